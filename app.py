@@ -24,12 +24,44 @@ col1, col2, col3 = st.columns(3)
 
 import pandas as pd
 from streamlit import column_config
-import json
+import orjson
+import stat
+from typing import List
+
+
+@st.cache_data(ttl=5)
+def list_files(folder: str, mtime_ns: int) -> List[str]:
+    """Return the sorted file names in `folder`.
+
+    `mtime_ns` is only part of the cache key: the folder mtime changes when
+    files are added or removed, so new entries show up without a manual clear.
+    `DirEntry.is_file()` reuses the dirent type from scandir (no extra stat).
+    """
+    with os.scandir(folder) as it:
+        return sorted(e.name for e in it if e.is_file())
+
+
+def folder_files(folder: str) -> List[str]:
+    """List files in `folder` via the cached helper; empty if it is not a directory."""
+    try:
+        info = os.stat(folder)
+    except OSError:
+        return []
+    if not stat.S_ISDIR(info.st_mode):
+        return []
+    return list_files(folder, info.st_mtime_ns)
+
+
+@st.cache_data(max_entries=64)
+def load_json(path: str, mtime: float) -> object:
+    """Parse a JSON file once per (path, mtime); edits to the file invalidate the entry."""
+    with open(path, "rb") as f:
+        return orjson.loads(f.read())
+
+
 with col1:
     cv_dir = os.environ.get("CV_DATA", "store/raw_data/CV")
-    cv_files = []
-    if os.path.isdir(cv_dir):
-        cv_files = sorted([f for f in os.listdir(cv_dir) if os.path.isfile(os.path.join(cv_dir, f))])
+    cv_files = folder_files(cv_dir)
     selected_cv = None
     
     if cv_files:
@@ -43,8 +75,7 @@ with col1:
         cv_json_data = None
         try:
             cv_path = os.path.join(cv_dir, selected_cv)
-            with open(cv_path, "r", encoding="utf-8") as f:
-                cv_json_data = json.load(f)
+            cv_json_data = load_json(cv_path, os.path.getmtime(cv_path))
         except Exception as e:
             st.error(f"Failed to load CV: {e}")
         cv_container = st.container(height=600)
@@ -56,9 +87,7 @@ with col1:
 
 with col2:
     jd_dir = os.environ.get("JD_DATA", "store/raw_data/JD")
-    jd_files = []
-    if os.path.isdir(jd_dir):
-        jd_files = sorted([f for f in os.listdir(jd_dir) if os.path.isfile(os.path.join(jd_dir, f))])
+    jd_files = folder_files(jd_dir)
     selected_jd = None
     if jd_files:
         selected_jd = st.selectbox(
@@ -71,8 +100,7 @@ with col2:
         jd_json_data = None
         try:
             jd_path = os.path.join(jd_dir, selected_jd)
-            with open(jd_path, "r", encoding="utf-8") as f:
-                jd_json_data = json.load(f)
+            jd_json_data = load_json(jd_path, os.path.getmtime(jd_path))
         except Exception as e:
             st.error(f"Failed to load JD: {e}")
         jd_container = st.container(height=600)
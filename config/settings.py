@@ -1,8 +1,10 @@
 
 """
-Minimal settings.py: Only loads .env variables.
+Minimal settings.py: loads .env variables and exposes them as AppConfig.
 """
 
+from dataclasses import dataclass, field
+import os
 from pathlib import Path
 from dotenv import load_dotenv
 
@@ -18,3 +20,24 @@ def load_envs():
 load_envs()
 
 
+def _env(name: str, default: str = "") -> str:
+    return os.getenv(name, default)
+
+
+@dataclass
+class AppConfig:
+    """Settings read from the environment (config/.env) when the instance is created.
+
+    Variable names and defaults match config/.env-example.
+    """
+    log_file_path: str = field(default_factory=lambda: _env("LOG_FILE_PATH", "logs/app.log"))
+    openai_api_key: str = field(default_factory=lambda: _env("OPENAI_API_KEY"))
+    openai_model: str = field(default_factory=lambda: _env("OPENAI_MODEL", "gpt-4o"))
+    openai_embedding_model: str = field(default_factory=lambda: _env("OPENAI_EMBEDDING_MODEL", "text-embedding-3-large"))
+    # Sizes the in-flight request limit in OpenAIManager (free, tier1 .. tier5)
+    openai_usage_tier: str = field(default_factory=lambda: _env("OPENAI_USAGE_TIER", "tier1"))
+    request_timeout_seconds: float = field(default_factory=lambda: float(_env("REQUEST_TIMEOUT_SECONDS", "60")))
+    # SQLite file backing the persistent embedding cache
+    embed_cache_path: str = field(default_factory=lambda: _env("EMBED_CACHE_PATH", "store/cache/embeddings.sqlite"))
+    # Embed the document text with its own call instead of mean-pooling section vectors
+    doc_embed_from_api: bool = field(default_factory=lambda: _env("DOC_EMBED_FROM_API", "false").lower() in ("1", "true", "yes"))
@@ -13,7 +13,48 @@ import argparse
 import os
 import shutil
 from pathlib import Path
-from typing import List, Set
+from typing import Iterator, List, Set, Tuple
+
+
+# Directory or file-name suffixes treated as cache artifacts
+CACHE_PATTERNS: Tuple[str, ...] = (
+    "__pycache__",
+    ".pyc",
+    ".pytest_cache",
+    ".coverage",
+    ".cache",
+    ".huggingface_cache",
+    "dist",
+    "build",
+    ".egg-info",
+    ".ipynb_checkpoints",
+)
+
+# Directory names the scan never enters: model artifacts, user data, Weaviate
+# persistence (store/weaviate_data), VCS metadata and vendored JS packages.
+PROTECTED_DIRS: Set[str] = {"models", "data", "weaviate_data", ".git", "node_modules"}
+
+
+def _walk(path: str, skip: Set[str], leaves: Set[str]) -> Iterator[os.DirEntry]:
+    """
+    Recursively yield directory entries under `path` using os.scandir.
+
+    Args:
+        path: Directory to scan
+        skip: Directory names or full paths that are neither yielded nor entered
+        leaves: Directory names that are yielded but not descended into
+
+    Uses the dirent type cached by scandir, so no per-entry stat is needed.
+    Symlinks are never followed.
+    """
+    with os.scandir(path) as it:
+        for entry in it:
+            is_dir = entry.is_dir(follow_symlinks=False)
+            if is_dir and (entry.name in skip or entry.path in skip):
+                continue
+            yield entry
+            if is_dir and entry.name not in leaves:
+                yield from _walk(entry.path, skip, leaves)
 
 
 def find_cache_files(base_path: Path) -> List[Path]:
@@ -26,19 +67,7 @@ def find_cache_files(base_path: Path) -> List[Path]:
     Returns:
         List of paths to cache files and directories
     """
-    cache_patterns: Set[str] = {
-        "__pycache__",
-        ".pyc",
-        ".pytest_cache",
-        ".coverage",
-        ".cache",
-        ".huggingface_cache",
-        "dist",
-        "build",
-        ".egg-info",
-        ".ipynb_checkpoints"
-    }
-    
+    cache_dirs = set(CACHE_PATTERNS)
     to_delete: List[Path] = []
 
     tests_dir = base_path / "tests"
@@ -56,37 +85,29 @@ def find_cache_files(base_path: Path) -> List[Path]:
                 pass
             to_delete.append(child)
     
-    for path in base_path.rglob("*"):
-        # Never delete anything inside tests/ref
-        try:
-            if tests_ref_dir.exists() and tests_ref_dir in path.parents:
-                continue
-        except Exception:
-            pass
-        # Always skip anything inside `models/` or `data/` directories to avoid accidental deletions
-        # This ensures the script will not remove model artifacts or user data.
-    # NOTE: We intentionally handle tests/results above; this guard is for top-level dirs.
-        if any(p in ("models", "data") for p in path.parts):
-            continue
-        # Additionally, protect the new Weaviate persistence path under store/weaviate_data
-        # from any cleanup.
-        if ("store" in path.parts) and ("weaviate_data" in path.parts):
-            continue
-            
-        # Check if path matches any cache pattern
-        if path.is_dir() and path.name in cache_patterns:
-            to_delete.append(path)
-        elif path.is_file() and any(path.name.endswith(pattern) for pattern in cache_patterns):
-            to_delete.append(path)
-    
+    # Never descend into PROTECTED_DIRS nor into tests/ref. tests/results and logs/ are
+    # purged wholesale, so their contents need no scan either.
+    skip: Set[str] = PROTECTED_DIRS | {
+        str(tests_ref_dir),
+        str(tests_results_dir),
+        str(base_path / "logs"),
+    }
+    for entry in _walk(str(base_path), skip, cache_dirs):
+        # Check entry against cache patterns; matched directories are not entered
+        if entry.is_dir(follow_symlinks=False):
+            if entry.name in cache_dirs:
+                to_delete.append(Path(entry.path))
+        elif entry.is_file(follow_symlinks=False) and entry.name.endswith(CACHE_PATTERNS):
+            to_delete.append(Path(entry.path))
+
     # Additionally, always remove all files and subdirectories under the top-level `logs/`
     # directory when present. We prefer to clear the contents but keep the `logs/`
     # directory itself in place.
     logs_dir = base_path / "logs"
     if logs_dir.exists() and logs_dir.is_dir():
         for child in logs_dir.iterdir():
-            # Skip if child is the project `models` or `data` directories by mistake
-            if any(p in ("models", "data") for p in child.parts):
+            # Skip if child is a protected directory placed there by mistake
+            if child.name in PROTECTED_DIRS:
                 continue
             to_delete.append(child)
 
@@ -11,8 +11,8 @@ This version is **fully compatible** with:
 
 It does the following:
 1. Connects to the running Weaviate instance
-2. Deletes ALL existing collections
-3. Reads a JSON schema file
+2. Reads and validates a JSON schema file (before anything is deleted)
+3. Deletes ALL existing collections
 4. Creates collections using the v4 API
 
 Usage:
@@ -21,12 +21,81 @@ Usage:
 If no file is provided, defaults to "weaviate_schema.json".
 """
 
-import json
 import sys
+from typing import Any, Dict, List, Tuple
+import fastjsonschema
+import orjson
 import weaviate
 from weaviate.classes.config import Property, DataType, Configure
 
 
+# Schema JSON data_type string -> Weaviate DataType
+_DTYPE_MAP = {
+    "text": DataType.TEXT,
+    "text[]": DataType.TEXT_ARRAY,
+    "number": DataType.NUMBER,
+    "int": DataType.INT,
+    "boolean": DataType.BOOL,
+}
+
+# Expected shape of the schema file; extra keys (description, vectorizer_config, ...)
+# are allowed and ignored.
+SCHEMA_META: Dict[str, Any] = {
+    "type": "object",
+    "required": ["classes"],
+    "properties": {
+        "classes": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "required": ["name"],
+                "properties": {
+                    "name": {"type": "string", "minLength": 1},
+                    "vectorizer": {"type": "string"},
+                    "properties": {
+                        "type": "array",
+                        "items": {
+                            "type": "object",
+                            "required": ["name", "data_type"],
+                            "properties": {
+                                "name": {"type": "string", "minLength": 1},
+                                "data_type": {
+                                    "type": "array",
+                                    "minItems": 1,
+                                    "items": [{"enum": list(_DTYPE_MAP)}],
+                                },
+                            },
+                        },
+                    },
+                },
+            },
+        },
+    },
+}
+
+# Compiled once at import; raises fastjsonschema.JsonSchemaException on mismatch
+_VALIDATE = fastjsonschema.compile(SCHEMA_META)
+
+
+def class_specs(schema: Dict[str, Any]) -> List[Tuple[str, str, List[Tuple[str, str]]]]:
+    """Project the schema down to the fields used to build collections.
+
+    Only ``name``, ``vectorizer`` and each property's ``name``/``data_type[0]``
+    are read; descriptions, vectorizer configs and any other keys are ignored.
+
+    Returns
+    - List of ``(class_name, vectorizer, [(prop_name, dtype), ...])`` tuples
+    """
+    return [
+        (
+            cls.get("name"),
+            cls.get("vectorizer", "none"),
+            [(p["name"], p["data_type"][0]) for p in cls.get("properties", [])],
+        )
+        for cls in schema.get("classes", [])
+    ]
+
+
 def main() -> None:
     # ------------------------------------------------------------------
     # Determine schema file path
@@ -50,9 +119,15 @@ def main() -> None:
     # Load schema JSON
     # ------------------------------------------------------------------
     print(f"[INFO] Loading schema JSON from: {schema_path}")
-    with open(schema_path, "r", encoding="utf-8") as f:
-        schema = json.load(f)
-    classes = schema.get("classes", [])
+    with open(schema_path, "rb") as f:
+        schema = orjson.loads(f.read())
+    # Validate before anything destructive happens below
+    try:
+        _VALIDATE(schema)
+    except fastjsonschema.JsonSchemaException as e:
+        print(f"[ERROR] Invalid schema file {schema_path}: {e.message}")
+        raise SystemExit(1)
+    classes = class_specs(schema)
     print(f"[INFO] JSON schema contains {len(classes)} classes.")
 
     # ------------------------------------------------------------------
@@ -68,32 +143,17 @@ def main() -> None:
     # Create new collections using v4 Collections API
     # ------------------------------------------------------------------
     print("[INFO] Creating new collections...")
-    for cls in classes:
-        class_name = cls.get("name")
+    for class_name, vectorizer, properties in classes:
         print(f"  → Creating: {class_name}")
 
         # Vectorizer
-        vectorizer = cls.get("vectorizer", "none")
         if vectorizer == "text2vec-openai":
             vectorizer_cfg = Configure.Vectorizer.text2vec_openai()
         else:
             vectorizer_cfg = Configure.Vectorizer.none()
 
         # Properties
-        props = []
-        for p in cls.get("properties", []):
-            name = p["name"]
-            dtype = p["data_type"][0]
-
-            dtype_map = {
-                "text": DataType.TEXT,
-                "text[]": DataType.TEXT_ARRAY,
-                "number": DataType.NUMBER,
-                "int": DataType.INT,
-                "boolean": DataType.BOOL,
-            }
-
-            props.append(Property(name=name, data_type=dtype_map[dtype]))
+        props = [Property(name=name, data_type=_DTYPE_MAP[dtype]) for name, dtype in properties]
 
         client.collections.create(
             name=class_name,
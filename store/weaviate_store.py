@@ -28,10 +28,14 @@ Environment variables (see .env):
 """
 
 
-import json
 import os
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+import orjson
 import weaviate
 from weaviate.classes.config import Property, DataType, Configure
+from weaviate.classes.query import Filter
+from weaviate.util import generate_uuid5
 from config import settings
 from utils.logger import AppLogger
 
@@ -52,8 +56,11 @@ class WeaviateStore:
         """
         self.url = url or os.getenv("WEAVIATE_URL", "http://localhost:8080")
         self.grpc_port = grpc_port or int(os.getenv("WEAVIATE_GRPC_PORT", "50051"))
-        self.client = weaviate.Client(
-            url=self.url,
+        # v4 client: REST for schema/queries, gRPC for inserts and batches
+        parsed = urlparse(self.url)
+        self.client = weaviate.connect_to_local(
+            host=parsed.hostname or "localhost",
+            port=parsed.port or 8080,
             grpc_port=self.grpc_port,
         )
         # Get log file path from settings.py (which loads .env)
@@ -64,6 +71,46 @@ class WeaviateStore:
             # fallback if not set
             log_path = "logs/app.log"
         self.logger = AppLogger(log_path)
+        # Resolve collection handles once; every insert reuses them
+        self._cv = self.client.collections.get("CV")
+        self._jd = self.client.collections.get("JobDescription")
+        self._documents = self.client.collections.get("Document")
+        self._sections = self.client.collections.get("Section")
+
+    def close(self) -> None:
+        """Close the underlying Weaviate connection (REST + gRPC)."""
+        self.client.close()
+
+    def _batch_write(self, collection, objects: List[Dict[str, Any]]) -> Tuple[List[str], List[Any]]:
+        """
+        Stream objects through the gRPC dynamic batcher.
+        Each item is a dict of `add_object` kwargs (properties, optional vector/uuid).
+        Returns (uuids in input order, failed objects reported by the batcher).
+        """
+        with collection.batch.dynamic() as batch:
+            uuids = [str(batch.add_object(**obj)) for obj in objects]
+        return uuids, collection.batch.failed_objects
+
+    def _read_object(self, json_path: str, label: str) -> Dict[str, Any]:
+        """Read one JSON object file; logs and raises FileNotFoundError if missing."""
+        if not os.path.isfile(json_path):
+            self.logger.log(f"{label} JSON file not found: {json_path}")
+            raise FileNotFoundError(f"{label} JSON file not found: {json_path}")
+        with open(json_path, "rb") as f:
+            return orjson.loads(f.read())
+
+    def _insert_many(self, collection, label: str, event: str, json_paths: List[str]) -> List[str]:
+        """Read all JSON files, then write them to `collection` through the gRPC batcher."""
+        objs = [self._read_object(p, label) for p in json_paths]
+        self.logger.log(f"Inserting {len(objs)} {label} objects into '{collection.name}' collection.")
+        uuids, failed = self._batch_write(collection, [{"properties": obj} for obj in objs])
+        if failed:
+            err = "; ".join(str(f.message) for f in failed)
+            self.logger.log_kv(f"{event}_OBJECTS_FAIL", errors=len(failed), error=err)
+            self.logger.flush()
+            raise RuntimeError(f"{label} batch insert failed: {err}")
+        self.logger.log_kv(f"{event}_OBJECTS_CREATED", count=len(uuids))
+        return uuids
 
     def create_cv_object(self, cv_json_path: str) -> str:
         """
@@ -74,13 +121,9 @@ class WeaviateStore:
         Returns:
             str: The UUID of the created object.
         """
-        if not os.path.isfile(cv_json_path):
-            self.logger.log(f"CV JSON file not found: {cv_json_path}")
-            raise FileNotFoundError(f"CV JSON file not found: {cv_json_path}")
-        with open(cv_json_path, "r", encoding="utf-8") as f:
-            obj = json.load(f)
+        obj = self._read_object(cv_json_path, "CV")
         self.logger.log(f"Inserting CV object from {cv_json_path} into 'CV' collection.")
-        uuid = self.client.collections.get("CV").data.insert(obj)
+        uuid = self._cv.data.insert(obj)
         self.logger.log_kv("CV_OBJECT_CREATED", uuid=uuid, file=cv_json_path)
         print(f"[CV] Inserted object UUID: {uuid}")
         return uuid
@@ -94,13 +137,142 @@ class WeaviateStore:
         Returns:
             str: The UUID of the created object.
         """
-        if not os.path.isfile(jd_json_path):
-            self.logger.log(f"JobDescription JSON file not found: {jd_json_path}")
-            raise FileNotFoundError(f"JobDescription JSON file not found: {jd_json_path}")
-        with open(jd_json_path, "r", encoding="utf-8") as f:
-            obj = json.load(f)
+        obj = self._read_object(jd_json_path, "JobDescription")
         self.logger.log(f"Inserting JobDescription object from {jd_json_path} into 'JobDescription' collection.")
-        uuid = self.client.collections.get("JobDescription").data.insert(obj)
+        uuid = self._jd.data.insert(obj)
         self.logger.log_kv("JD_OBJECT_CREATED", uuid=uuid, file=jd_json_path)
         print(f"[JobDescription] Inserted object UUID: {uuid}")
         return uuid
+
+    def create_cv_objects(self, cv_json_paths: List[str]) -> List[str]:
+        """
+        Insert several CV objects into the 'CV' collection through the gRPC batcher.
+        Args:
+            cv_json_paths (list[str]): Paths to CV JSON files.
+        Returns:
+            list[str]: UUIDs of the created objects, in input order.
+        """
+        return self._insert_many(self._cv, "CV", "CV", cv_json_paths)
+
+    def create_jd_objects(self, jd_json_paths: List[str]) -> List[str]:
+        """
+        Insert several JobDescription objects into the 'JobDescription' collection through the gRPC batcher.
+        Args:
+            jd_json_paths (list[str]): Paths to JobDescription JSON files.
+        Returns:
+            list[str]: UUIDs of the created objects, in input order.
+        """
+        return self._insert_many(self._jd, "JobDescription", "JD", jd_json_paths)
+
+    def section_vectors(self, embed_hashes: List[str], hash_alg: str) -> Dict[str, List[float]]:
+        """
+        Look up stored Section vectors by content hash.
+        Hashes already encode the embedding model, so a hit is safe to reuse.
+        The same text can be stored under several documents, so one hash may
+        match many rows; the query is repeated for unresolved hashes until every
+        hash is resolved or a result page comes back short.
+        Args:
+            embed_hashes (list[str]): Section `embed_hash` values to look up.
+            hash_alg (str): Algorithm that produced the hashes; only rows tagged
+                with the same `hash_alg` match.
+        Returns:
+            dict: embed_hash -> vector for the hashes found; missing ones are omitted
+            (all of them if the Section collection does not exist yet).
+        """
+        remaining = list(dict.fromkeys(embed_hashes))
+        if not remaining or not self.client.collections.exists("Section"):
+            return {}
+        found: Dict[str, List[float]] = {}
+        seen = set()
+        while remaining:
+            res = self._sections.query.fetch_objects(
+                filters=(
+                    Filter.by_property("embed_hash").contains_any(remaining)
+                    & Filter.by_property("hash_alg").equal(hash_alg)
+                ),
+                include_vector=True,
+                return_properties=["embed_hash"],
+                limit=len(remaining),
+            )
+            for obj in res.objects:
+                embed_hash = obj.properties["embed_hash"]
+                seen.add(embed_hash)
+                vec = obj.vector.get("default") if obj.vector else None
+                if vec and embed_hash not in found:
+                    found[embed_hash] = vec
+            if len(res.objects) < len(remaining):
+                break
+            remaining = [h for h in remaining if h not in seen]
+        return found
+
+    def upsert_document(
+        self,
+        doc_hash: str,
+        filename: str,
+        text: str,
+        attrs: Dict[str, Any],
+        vector: Optional[Any] = None,
+    ) -> Dict[str, Any]:
+        """
+        Write (or overwrite) the Document object for a vectorized file.
+        The UUID is derived from `doc_hash`, so re-indexing the same content
+        replaces the existing Document instead of duplicating it.
+        Args:
+            doc_hash (str): Content hash of the document; stored as `sha`.
+            filename (str): Source file name.
+            text (str): Full document text.
+            attrs (dict): Remaining Document properties (candidate_id, source,
+                normalized metadata, embed_model, embed_hash, hash_alg, ...).
+            vector (list[float], optional): Document vector; None stores no vector.
+        Returns:
+            dict: {"ok": bool, "count": int, "error": str}
+        """
+        obj = {
+            "properties": {"sha": doc_hash, "filename": filename, "text": text, **attrs},
+            "vector": vector,
+            "uuid": generate_uuid5(doc_hash),
+        }
+        _, failed = self._batch_write(self._documents, [obj])
+        if failed:
+            err = "; ".join(str(f.message) for f in failed)
+            self.logger.log_kv("DOCUMENT_UPSERT_FAIL", sha=doc_hash, error=err)
+            self.logger.flush()
+            return {"ok": False, "count": 0, "error": err}
+        self.logger.log_kv("DOCUMENT_UPSERTED", sha=doc_hash, filename=filename)
+        return {"ok": True, "count": 1, "error": ""}
+
+    def upsert_sections(
+        self,
+        parent_sha: str,
+        sections: List[Dict[str, Any]],
+        doc_meta: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Write all Section objects of a document through the gRPC batcher.
+        Object UUIDs are derived from (parent_sha, position, embed_hash), so
+        re-indexing the same document overwrites its sections instead of
+        duplicating them, while repeated text within a document (e.g. a footer
+        on every page) still yields one object per section.
+        Args:
+            parent_sha (str): Content hash of the parent Document.
+            sections (list[dict]): Section properties; each must carry `embed_hash`
+                and a `vector` entry (popped off and sent as the object vector).
+            doc_meta (dict, optional): Document-level properties (e.g. skills_norm,
+                alma_mater, industries_norm) merged into every section.
+        Returns:
+            dict: {"ok": bool, "count": int, "error": str}
+        """
+        objects = []
+        for position, section in enumerate(sections):
+            props = {**section, **(doc_meta or {})}
+            vector = props.pop("vector", None)
+            uuid = generate_uuid5(f"{parent_sha}:{position}:{props['embed_hash']}")
+            objects.append({"properties": props, "vector": vector, "uuid": uuid})
+        _, failed = self._batch_write(self._sections, objects)
+        if failed:
+            err = "; ".join(str(f.message) for f in failed)
+            self.logger.log_kv("SECTIONS_UPSERT_FAIL", parent_sha=parent_sha, errors=len(failed), error=err)
+            self.logger.flush()
+            return {"ok": False, "count": len(objects) - len(failed), "error": err}
+        self.logger.log_kv("SECTIONS_UPSERTED", parent_sha=parent_sha, count=len(objects))
+        return {"ok": True, "count": len(objects), "error": ""}
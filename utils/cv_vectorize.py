@@ -13,9 +13,12 @@ Notes
 """
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass
-import hashlib
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from blake3 import blake3
+import numpy as np
 
 from config.settings import AppConfig
 from utils.logger import AppLogger
@@ -25,16 +28,49 @@ from store.weaviate_store import WeaviateStore
 
 MAX_CHARS_PER_CHUNK = 4000  # ~3k chars was OK; keep a guardrail
 EMBED_MODEL_DEFAULT = "text-embedding-3-large"
+HASH_ALG = "blake3"  # persisted with embed_hash; rows tagged otherwise were hashed differently
+
+# Embeddings come back as float32 rows (np.ndarray); Weaviate hits are lists
+Vector = Union[np.ndarray, List[float]]
+
+_PREFIX_CACHE: Dict[str, blake3] = {}
+
+
+def _hash_state(model: str) -> blake3:
+    # The model prefix is invariant per run: hash it once, then clone the state
+    base = _PREFIX_CACHE.get(model)
+    if base is None:
+        base = blake3()
+        base.update(model.encode("utf-8"))
+        base.update(b"\x00")
+        _PREFIX_CACHE[model] = base
+    return base.copy()
 
 
 def _hash_text(s: str, model: str) -> str:
-    h = hashlib.sha256()
-    h.update(model.encode("utf-8"))
-    h.update(b"\x00")
+    h = _hash_state(model)
     h.update((s or "").encode("utf-8", errors="ignore"))
     return h.hexdigest()
 
 
+def _hash_joined(parts: Iterable[str], model: str, sep: str = "\n\n") -> str:
+    """Same digest as `_hash_text(sep.join(parts), model)`, without building the joined string."""
+    h = _hash_state(model)
+    sep_b = sep.encode("utf-8")
+    for i, part in enumerate(parts):
+        if i:
+            h.update(sep_b)
+        h.update(part.encode("utf-8", errors="ignore"))
+    return h.hexdigest()
+
+
+def _norm_list(value: Any) -> List[str]:
+    """Strip/lowercase a tag list (or comma-separated string) in one pass, dropping empties."""
+    if isinstance(value, str):
+        value = value.split(",")
+    return [t for t in (str(x).strip().lower() for x in value or [] if x) if t]
+
+
 def _truncate(s: str, max_chars: int = MAX_CHARS_PER_CHUNK) -> str:
     if not s:
         return ""
@@ -43,6 +79,43 @@ def _truncate(s: str, max_chars: int = MAX_CHARS_PER_CHUNK) -> str:
     return s[:max_chars]
 
 
+def _mean_pool(vectors: List[Vector]) -> List[float]:
+    """L2-normalized mean of the section vectors, used as the document vector."""
+    mean = np.asarray(vectors, dtype=np.float32).mean(axis=0)
+    norm = float(np.linalg.norm(mean))
+    return (mean / norm if norm else mean).tolist()
+
+
+async def _embed_concurrently(
+    openai_mgr: OpenAIManager,
+    texts: List[str],
+    doc_text: Optional[str],
+    model: str,
+    batch_size: int,
+) -> Tuple[np.ndarray, Vector]:
+    """Embed the section texts (and the document text, if given) in parallel.
+
+    Section texts are split into `batch_size` requests by `aembed_texts`.
+
+    Returns (section_vectors, doc_vector). The document vector is optional:
+    a failure there, or doc_text=None, yields [] instead of aborting the
+    section embeddings.
+    """
+    async def _doc() -> Vector:
+        if doc_text is None:
+            return []
+        try:
+            return (await openai_mgr.aembed_texts([doc_text], model=model))[0]
+        except Exception:
+            return []
+
+    section_vectors, doc_vector = await asyncio.gather(
+        openai_mgr.aembed_texts(texts, model=model, batch_size=batch_size),
+        _doc(),
+    )
+    return section_vectors, doc_vector
+
+
 @dataclass
 class VectorizeResult:
     document_sha: str
@@ -66,32 +139,64 @@ def vectorize_and_upsert(
     Inputs
     - final_json: Aggregated JSON persisted under store/results/cv_json/<sha>.json
       Expected keys: candidate_id, source, sections (list of {text, section, subsection, page_start, page_end})
+    - cfg.doc_embed_from_api (DOC_EMBED_FROM_API): Embed the (truncated)
+      document text with an extra OpenAI call; by default the doc vector is the
+      mean-pooled section vectors
 
     Returns
     - VectorizeResult with counts and model info
     """
     cfg = cfg or AppConfig()
     logger = logger or AppLogger(cfg.log_file_path)
+    owns_mgr = openai_mgr is None
     openai_mgr = openai_mgr or OpenAIManager(cfg, logger)
-    store = store or WeaviateStore(cfg)
-    model = embed_model or EMBED_MODEL_DEFAULT
+    owns_store = store is None
+    store = store or WeaviateStore(log_file_path=cfg.log_file_path)
+    try:
+        return _vectorize(
+            final_json,
+            logger=logger,
+            openai_mgr=openai_mgr,
+            store=store,
+            model=embed_model or EMBED_MODEL_DEFAULT,
+            batch_size=batch_size,
+            doc_embed_from_api=cfg.doc_embed_from_api,
+        )
+    finally:
+        # Collaborators created here would otherwise hold their connections
+        # (Weaviate REST + gRPC, OpenAI pool, event loop, SQLite) until exit
+        if owns_store:
+            store.close()
+        if owns_mgr:
+            openai_mgr.close()
 
 
+def _vectorize(
+    final_json: Dict[str, Any],
+    *,
+    logger: AppLogger,
+    openai_mgr: OpenAIManager,
+    store: WeaviateStore,
+    model: str,
+    batch_size: int,
+    doc_embed_from_api: bool,
+) -> VectorizeResult:
+    """Body of `vectorize_and_upsert` once its collaborators are resolved."""
     candidate_id = str(final_json.get("candidate_id") or "")
     source = str(final_json.get("source") or "")
     sections = final_json.get("sections") or []
     extraction = final_json.get("extraction") or {}
 
     # Derive sha from source content (path may have changed); prefer file sha in name
-    # If not available, hash concatenated chunk text
-    doc_text_concat = "\n\n".join([str((s or {}).get("text") or "") for s in sections])
-    doc_hash = _hash_text(doc_text_concat, model)
+    # If not available, hash concatenated chunk text (streamed, no joined copy)
+    section_texts = [str((s or {}).get("text") or "") for s in sections]
+    doc_hash = _hash_joined(section_texts, model)
 
     # Prepare chunk texts with truncation
     items: List[Tuple[str, Dict[str, Any]]] = []
     for ch in sections:
         txt = _truncate(str(ch.get("text") or ""))
-        if not txt:
+        if not txt.strip():
             continue
         meta = {
             "section": (ch.get("section") or "").strip(),
@@ -106,86 +211,85 @@ def vectorize_and_upsert(
         logger.log_kv("CV_VEC_SKIP_EMPTY", source=source)
         return VectorizeResult(document_sha=doc_hash, document_vector_dim=0, sections_indexed=0, model=model)
 
-    # Compute embeddings in batches
-    texts = [t for t, _ in items]
-    vectors: List[List[float]] = []
-    for i in range(0, len(texts), max(1, int(batch_size))):
-        batch = texts[i:i + batch_size]
-        vecs = openai_mgr.embed_texts(batch, model=model)
-        vectors.extend(vecs)
+    # Full document text is only needed from here on (Document write + doc vector)
+    doc_text_concat = "\n\n".join(section_texts)
+
+    # Reuse vectors of Sections already stored in Weaviate; the remaining unique
+    # texts go to OpenAIManager, whose own caches absorb in-process repeats
+    hashes = [_hash_text(t, model) for t, _ in items]
+    known: Dict[str, Vector] = store.section_vectors(list(dict.fromkeys(hashes)), HASH_ALG)
+    todo: Dict[str, str] = {}
+    for (t, _), h in zip(items, hashes):
+        if h not in known:
+            todo.setdefault(h, t)
+    logger.log_kv("CV_VEC_EMBED_REUSE", parent_sha=doc_hash, stored=len(known), embed=len(todo))
+
+    # Compute embeddings: section batches and, if requested, the document-level
+    # vector (coarse recall) are sent concurrently
+    doc_input = _truncate(doc_text_concat, MAX_CHARS_PER_CHUNK * 2) if doc_embed_from_api else None
+    new_vecs, doc_vector = openai_mgr.run_async(
+        _embed_concurrently(openai_mgr, list(todo.values()), doc_input, model, max(1, int(batch_size)))
+    )
+    known.update(zip(todo, new_vecs))
+    vectors = [known[h] for h in hashes]
+    if not doc_embed_from_api:
+        doc_vector = _mean_pool(vectors)
 
-    # Optional document-level vector (coarse recall)
-    doc_vector: List[float] = []
-    try:
-        doc_vector = openai_mgr.embed_texts([_truncate(doc_text_concat, MAX_CHARS_PER_CHUNK * 2)], model=model)[0]
-    except Exception:
-        doc_vector = []
-
-
-    # Extract normalized metadata for routing (if present in extraction)
-    def _lower_list(lst):
-        return [str(x).strip().lower() for x in lst if x]
-
-    skills_norm = []
-    if isinstance(extraction, dict):
-        skills = extraction.get("skills_norm", []) or []
-        if isinstance(skills, str):
-            # If skills_norm is a comma-separated string, split it
-            skills = [s.strip() for s in skills.split(",") if s.strip()]
-        skills_norm = _lower_list(skills)
-    alma_mater = str(extraction.get("alma_mater") or "") if isinstance(extraction, dict) else ""
-    industries_norm = []
-    if isinstance(extraction, dict):
-        inds = extraction.get("industries_norm", []) or []
-        if isinstance(inds, str):
-            inds = [s.strip() for s in inds.split(",") if s.strip()]
-        industries_norm = _lower_list(inds)
+
+    # Extract normalized metadata for routing (if present in extraction).
+    # Document-level: computed once and shared by the Document and every Section.
+    ext = extraction if isinstance(extraction, dict) else {}
+    doc_meta: Dict[str, Any] = {
+        "skills_norm": _norm_list(ext.get("skills_norm")),
+        "alma_mater": str(ext.get("alma_mater") or ""),
+        "industries_norm": _norm_list(ext.get("industries_norm")),
+    }
 
     # Upsert Document (filename from path)
     filename = source.split("/")[-1].split("\\")[-1]
     attrs = {
         "candidate_id": candidate_id,
         "source": source,
-        "skills_norm": skills_norm,
-        "alma_mater": alma_mater,
-        "industries_norm": industries_norm,
+        **doc_meta,
         "extraction": extraction,
         "embed_model": model,
         "embed_hash": doc_hash,
+        "hash_alg": HASH_ALG,
     }
-    doc_obj = store.docs.write(doc_hash, filename, doc_text_concat, attrs, vector=doc_vector)
-    if not doc_obj:
-        raise RuntimeError("Document write failed or could not be verified in Weaviate")
+    doc_res = store.upsert_document(doc_hash, filename, doc_text_concat, attrs, vector=doc_vector if len(doc_vector) else None)
+    if not doc_res.get("ok"):
+        raise RuntimeError(f"Document upsert failed: {doc_res.get('error')}")
 
-    # Upsert Sections with vectors
-    for (text, meta), vec in zip(items, vectors):
-        embed_hash = _hash_text(text, model)
+    # Upsert Sections with vectors (one batched write for the whole document)
+    section_objs: List[Dict[str, Any]] = []
+    for (text, meta), vec, embed_hash in zip(items, vectors, hashes):
         if logger:
-            logger.log_kv("VECTORIZE_SECTION_UPSERT", parent_sha=doc_hash, section=meta.get('section'), page_start=meta.get('page_start'), vector_dim=(len(vec) if vec else 0))
-        res = store.upsert_section(
-            parent_sha=doc_hash,
-            section=meta.get("section") or "",
-            subsection=meta.get("subsection") or "",
-            text=text,
-            page_start=meta.get("page_start"),
-            page_end=meta.get("page_end"),
-            vector=vec,
-            model=model,
-            embed_hash=embed_hash,
-            skills_norm=skills_norm,
-            alma_mater=alma_mater,
-            industries_norm=industries_norm,
-        )
-        # Check upsert result and fail fast so callers see errors instead of silent drops
-        if not isinstance(res, dict) or not res.get("ok"):
-            err = res.get("error") if isinstance(res, dict) else str(res)
-            if logger:
-                logger.log_kv("VECTORIZE_SECTION_UPSERT_FAIL", parent_sha=doc_hash, section=meta.get('section'), page_start=meta.get('page_start'), error=err)
-            raise RuntimeError(f"Section upsert failed: {err}")
+            logger.log_kv("VECTORIZE_SECTION_UPSERT", parent_sha=doc_hash, section=meta.get('section'), page_start=meta.get('page_start'), vector_dim=len(vec))
+        section_objs.append({
+            "parent_sha": doc_hash,
+            "section": meta.get("section") or "",
+            "subsection": meta.get("subsection") or "",
+            "text": text,
+            "page_start": meta.get("page_start"),
+            "page_end": meta.get("page_end"),
+            "vector": vec,
+            "embed_model": model,
+            "embed_hash": embed_hash,
+            "hash_alg": HASH_ALG,
+        })
+    res = store.upsert_sections(doc_hash, section_objs, doc_meta)
+    # Check upsert result and fail fast so callers see errors instead of silent drops
+    if not isinstance(res, dict) or not res.get("ok"):
+        err = res.get("error") if isinstance(res, dict) else str(res)
+        if logger:
+            logger.log_kv("VECTORIZE_SECTION_UPSERT_FAIL", parent_sha=doc_hash, sections=len(section_objs), error=err)
+            logger.flush()
+        raise RuntimeError(f"Section upsert failed: {err}")
 
+    logger.flush()
     return VectorizeResult(
         document_sha=doc_hash,
-        document_vector_dim=(len(doc_vector) if doc_vector else 0),
+        document_vector_dim=len(doc_vector),
         sections_indexed=len(items),
         model=model,
     )
@@ -0,0 +1,73 @@
+"""Persistent content-addressed embedding cache backed by SQLite.
+
+Keys are ``sha256(model || "\\0" || text)`` digests; values are float32 vector
+bytes. Used by OpenAIManager so repeated ingestion of identical chunks never
+hits the embeddings API twice.
+"""
+from __future__ import annotations
+
+import hashlib
+from pathlib import Path
+import sqlite3
+import threading
+from typing import Dict, Iterable, Tuple
+
+import numpy as np
+
+
+# Stay well under SQLite's host-parameter limit for `IN (...)` lookups
+_MAX_PARAMS = 900
+
+
+class EmbeddingCache:
+    """SQLite table ``cache(key BLOB PRIMARY KEY, vec BLOB)``.
+
+    Responsibilities
+    - Derive a stable key per (model, text).
+    - Bulk lookup of cached vectors and bulk insert of new ones.
+
+    Vectors are stored as float32 (half the bytes of float64) and returned as
+    1-D float32 arrays.
+    """
+
+    def __init__(self, db_path: str) -> None:
+        """Open (or create) the cache database; parent directories are created."""
+        path = Path(db_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("CREATE TABLE IF NOT EXISTS cache (key BLOB PRIMARY KEY, vec BLOB)")
+        self._conn.commit()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(model: str, text: str) -> bytes:
+        """Content address for `text` embedded with `model`."""
+        return hashlib.sha256(f"{model}\0{text}".encode("utf-8", errors="ignore")).digest()
+
+    def get_many(self, keys: Iterable[bytes]) -> Dict[bytes, np.ndarray]:
+        """Return cached vectors for the keys found; missing keys are omitted."""
+        uniq = list(dict.fromkeys(keys))
+        found: Dict[bytes, np.ndarray] = {}
+        with self._lock:
+            for i in range(0, len(uniq), _MAX_PARAMS):
+                chunk = uniq[i:i + _MAX_PARAMS]
+                marks = ",".join("?" * len(chunk))
+                rows = self._conn.execute(f"SELECT key, vec FROM cache WHERE key IN ({marks})", chunk)
+                for k, vec in rows:
+                    found[k] = np.frombuffer(vec, dtype=np.float32)
+        return found
+
+    def put_many(self, items: Iterable[Tuple[bytes, np.ndarray]]) -> None:
+        """Insert or replace (key, vector) pairs in one transaction."""
+        rows = [(k, np.asarray(v, dtype=np.float32).tobytes()) for k, v in items]
+        if not rows:
+            return
+        with self._lock:
+            self._conn.executemany("INSERT OR REPLACE INTO cache (key, vec) VALUES (?, ?)", rows)
+            self._conn.commit()
+
+    def close(self) -> None:
+        """Close the underlying SQLite connection."""
+        with self._lock:
+            self._conn.close()
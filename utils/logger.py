@@ -4,8 +4,40 @@ All writes go to the path configured in LOG_FILE_PATH (config/.env via AppConfig
 """
 from __future__ import annotations
 
-from datetime import datetime
+import atexit
 from pathlib import Path
+import threading
+import time
+from typing import Dict, List, TextIO
+
+
+# One buffered append handle per log file, shared by every AppLogger on that
+# path so lines from different loggers stay in order.
+_HANDLES: Dict[Path, TextIO] = {}
+_LOCK = threading.Lock()
+# Cached "[YYYY-MM-DD HH:MM:SS] " prefix, recomputed only when the second changes
+_STAMP: List[object] = [-1, ""]
+# Buffered lines reach disk at most this many seconds after being written
+FLUSH_INTERVAL_S = 1.0
+_FLUSHER: List[threading.Thread] = []
+
+
+def _flush_loop() -> None:
+    while True:
+        time.sleep(FLUSH_INTERVAL_S)
+        with _LOCK:
+            for fh in _HANDLES.values():
+                fh.flush()
+
+
+def _close_all() -> None:
+    with _LOCK:
+        for fh in _HANDLES.values():
+            fh.close()
+        _HANDLES.clear()
+
+
+atexit.register(_close_all)
 
 
 class AppLogger:
@@ -13,12 +45,13 @@ class AppLogger:
 
     Responsibilities
     - Ensure the log directory exists on initialization.
-    - Provide a small, synchronous append-only API for textual and
-      key/value style logs. Each log line is prefixed with a local
-      timestamp.
+    - Provide a small append-only API for textual and key/value style
+      logs. Each log line is prefixed with a local timestamp.
 
-    The logger is intentionally tiny and synchronous to keep behavior
-    deterministic during short-running scripts and tests.
+    Writes go through a persistent buffered handle (one per log file) instead
+    of reopening the file per line; a background thread flushes every
+    FLUSH_INTERVAL_S, and the buffer is also flushed when full, on
+    :meth:`flush`, and at interpreter exit. Writes are thread-safe.
     """
 
     def __init__(self, log_file_path: str) -> None:
@@ -31,6 +64,27 @@ class AppLogger:
         """
         self._log_path = Path(log_file_path)
         self._log_path.parent.mkdir(parents=True, exist_ok=True)
+        self._key = self._log_path.resolve()
+
+    def _handle(self) -> TextIO:
+        """Return the shared append handle for this path (caller holds _LOCK)."""
+        fh = _HANDLES.get(self._key)
+        if fh is None:
+            fh = self._log_path.open("a", encoding="utf-8", buffering=8192)
+            _HANDLES[self._key] = fh
+            if not _FLUSHER:
+                _FLUSHER.append(threading.Thread(target=_flush_loop, name="applogger-flush", daemon=True))
+                _FLUSHER[0].start()
+        return fh
+
+    def _write(self, message: str) -> None:
+        """Write one timestamped line (prefix reused within the same second)."""
+        now = int(time.time())
+        with _LOCK:
+            if _STAMP[0] != now:
+                _STAMP[0] = now
+                _STAMP[1] = time.strftime("[%Y-%m-%d %H:%M:%S] ", time.localtime(now))
+            self._handle().write("".join((_STAMP[1], message, "\n")))
 
     def log(self, message: str) -> None:
         """Append a single-line message to the log file with a timestamp.
@@ -39,9 +93,7 @@ class AppLogger:
         - message: Text string to append. The logger will add a local
           timestamp in the format ``YYYY-MM-DD HH:MM:SS`` and a newline.
         """
-        stamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        with self._log_path.open("a", encoding="utf-8") as f:
-            f.write(f"[{stamp}] {message}\n")
+        self._write(message)
 
     def log_kv(self, event: str, **fields: object) -> None:
         """Log an event name with structured key/value pairs.
@@ -55,6 +107,14 @@ class AppLogger:
         - event: Short event name
         - **fields: Arbitrary data values to attach to the event
         """
-        parts = [f"{k}={v}" for k, v in fields.items()]
-        msg = f"{event} | " + " ".join(parts) if parts else event
-        self.log(msg)
+        if not fields:
+            self._write(event)
+            return
+        self._write(event + " | " + " ".join([f"{k}={v}" for k, v in fields.items()]))
+
+    def flush(self) -> None:
+        """Push buffered lines to disk; call at important boundaries (failures, end of a run)."""
+        with _LOCK:
+            fh = _HANDLES.get(self._key)
+            if fh is not None:
+                fh.flush()
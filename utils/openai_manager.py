@@ -1,11 +1,193 @@
 from __future__ import annotations
-from typing import Any, Dict, Iterable, List, Optional
-import json
-import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from itertools import islice
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, TypeVar
+import asyncio
+import atexit
+import base64
+import random
+import threading
+import weakref
 
-from openai import OpenAI
+import fastjsonschema
+import httpx
+import numpy as np
+from openai import APIError, APIStatusError, AsyncOpenAI, OpenAI, RateLimitError
+import orjson
+from tenacity import AsyncRetrying, RetryCallState, Retrying, retry_if_exception, stop_after_attempt
+import tiktoken
 from config.settings import AppConfig
+from utils.embedding_cache import EmbeddingCache
 from utils.logger import AppLogger
+from utils.semantic_cache import SemanticCache
+
+
+T = TypeVar("T")
+
+# Max in-flight OpenAI requests per usage tier (cfg.openai_usage_tier)
+_TIER_LIMITS: Dict[str, int] = {
+    "free": 1,
+    "tier1": 35,
+    "tier2": 60,
+    "tier3": 60,
+    "tier4": 125,
+    "tier5": 125,
+}
+
+_SLOT_POLL_S = 0.01  # async wait between attempts to take a tier slot
+
+EMBED_LRU_MAXSIZE = 10_000  # in-process (model, text) -> vector entries
+CHAT_CACHE_MAX_PROMPTS = 64  # (model, system_prompt) pairs with a semantic chat cache
+EMBED_MAX_ROWS = 2048  # provider limit on inputs per embeddings request
+EMBED_MAX_TOKENS = 300_000  # provider limit on total tokens per embeddings request
+EMBED_MAX_ROW_TOKENS = 8191  # text-embedding-3-* limit per input
+# Documented default vector widths; used when a call embeds nothing (all inputs blank)
+EMBED_DIMS: Dict[str, int] = {
+    "text-embedding-3-small": 1536,
+    "text-embedding-3-large": 3072,
+    "text-embedding-ada-002": 1536,
+}
+
+
+# Shared keep-alive pool settings for all OpenAI traffic (HTTP/2 multiplexed)
+_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=40, max_connections=100, keepalive_expiry=30)
+_HTTP_TIMEOUT = httpx.Timeout(300.0, connect=10.0)
+
+
+@lru_cache(maxsize=1)
+def _http_client() -> httpx.Client:
+    """Process-wide sync HTTP/2 client shared by every manager; closed at exit."""
+    client = httpx.Client(http2=True, limits=_HTTP_LIMITS, timeout=_HTTP_TIMEOUT)
+    atexit.register(client.close)
+    return client
+
+
+def _status_code(err: BaseException) -> Optional[int]:
+    """HTTP status carried by an SDK or raw httpx error, if any."""
+    if isinstance(err, APIStatusError):
+        return err.status_code
+    if isinstance(err, httpx.HTTPStatusError):
+        return err.response.status_code
+    return None
+
+
+def _backoff_delay(attempt: int, err: Exception) -> float:
+    """Seconds to wait before retry `attempt + 1`.
+
+    For 429s the server's Retry-After (seconds) is honored; otherwise the
+    capped exponential backoff gets +/-25% jitter to avoid synchronized retries.
+    """
+    if isinstance(err, RateLimitError) or _status_code(err) == 429:
+        retry_after = err.response.headers.get("Retry-After")
+        try:
+            return max(0.0, float(retry_after))
+        except (TypeError, ValueError):
+            pass
+    base = min(2 ** attempt, 8)
+    return base * random.uniform(0.75, 1.25)
+
+
+# Failures worth another attempt: API/transport errors (SDK and raw httpx),
+# timeouts, and malformed or schema-violating payloads. 4xx responses other
+# than 429 (bad request, auth, not found, ...) will not succeed on retry, and
+# anything else is a bug; both surface immediately.
+_RETRYABLE = (
+    APIError,
+    httpx.HTTPError,
+    TimeoutError,
+    asyncio.TimeoutError,
+    orjson.JSONDecodeError,
+    fastjsonschema.JsonSchemaValueException,
+)
+
+
+def _is_retryable(err: BaseException) -> bool:
+    """tenacity retry predicate: transient failures only."""
+    status = _status_code(err)
+    if status is not None and 400 <= status < 500 and status != 429:
+        return False
+    return isinstance(err, _RETRYABLE)
+
+
+def _retry_wait(state: RetryCallState) -> float:
+    """tenacity wait strategy delegating to `_backoff_delay` (keeps Retry-After support)."""
+    return _backoff_delay(state.attempt_number, state.outcome.exception())
+
+
+def _http_error(resp: httpx.Response) -> httpx.HTTPStatusError:
+    """HTTPStatusError for a failed raw request, carrying OpenAI's `error.message`."""
+    detail = resp.reason_phrase
+    try:
+        detail = orjson.loads(resp.content)["error"]["message"] or detail
+    except (orjson.JSONDecodeError, KeyError, TypeError):
+        pass  # non-JSON or unexpected error body: keep the reason phrase
+    return httpx.HTTPStatusError(f"{resp.status_code} {detail}", request=resp.request, response=resp)
+
+
+@lru_cache(maxsize=64)
+def _compiled_schema(schema_key: bytes) -> Callable[[Any], Any]:
+    """Validator for a response schema, compiled once per distinct schema.
+
+    `schema_key` is the schema serialized with sorted keys, so equal dicts
+    share one validator regardless of identity or key order.
+    """
+    return fastjsonschema.compile(orjson.loads(schema_key))
+
+
+@lru_cache(maxsize=1)
+def _encoding() -> "tiktoken.Encoding":
+    """Tokenizer used by text-embedding-3-* (loaded once)."""
+    return tiktoken.get_encoding("cl100k_base")
+
+
+def _pack_batches(texts: List[str], max_rows: int) -> Tuple[List[str], List[Tuple[int, int]]]:
+    """Fit `texts` to the embeddings limits before any request is sent.
+
+    Rows over EMBED_MAX_ROW_TOKENS are truncated to that many tokens, then
+    rows are greedily packed into [start, end) slices under both `max_rows`
+    and EMBED_MAX_TOKENS. Tokenization runs on tiktoken's thread pool.
+    Returns the (possibly truncated) texts and the slices.
+    """
+    enc = _encoding()
+    fitted = list(texts)
+    lens: List[int] = []
+    for i, toks in enumerate(enc.encode_ordinary_batch(fitted)):
+        if len(toks) > EMBED_MAX_ROW_TOKENS:
+            toks = toks[:EMBED_MAX_ROW_TOKENS]
+            fitted[i] = enc.decode(toks)
+        lens.append(len(toks))
+    slices: List[Tuple[int, int]] = []
+    start, tokens = 0, 0
+    for i, n in enumerate(lens):
+        if i > start and (i - start >= max_rows or tokens + n > EMBED_MAX_TOKENS):
+            slices.append((start, i))
+            start, tokens = i, 0
+        tokens += n
+    if start < len(fitted):
+        slices.append((start, len(fitted)))
+    return fitted, slices
+
+
+def _release(
+    loop: asyncio.AbstractEventLoop,
+    loop_thread: threading.Thread,
+    ahttp: httpx.AsyncClient,
+    embed_cache: EmbeddingCache,
+) -> None:
+    """Close a manager's async pool, loop thread and cache (finalizer; holds no manager ref)."""
+    if loop.is_closed():
+        return
+    # Collected on the loop thread itself: it cannot wait on its own work
+    if threading.current_thread() is not loop_thread:
+        asyncio.run_coroutine_threadsafe(ahttp.aclose(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        loop_thread.join()
+        loop.close()
+    else:
+        loop.stop()
+    embed_cache.close()
 
 
 class OpenAIManager:
@@ -14,7 +196,189 @@ class OpenAIManager:
     def __init__(self, cfg: AppConfig, logger: Optional[AppLogger] = None) -> None:
         self.cfg = cfg
         self.logger = logger or AppLogger(cfg.log_file_path)
-        self.client = OpenAI(api_key=cfg.openai_api_key)
+        self.client = OpenAI(api_key=cfg.openai_api_key, http_client=_http_client())
+        # Async pools are bound to the loop that drives them, so each manager
+        # owns one next to its event loop
+        self._ahttp = httpx.AsyncClient(http2=True, limits=_HTTP_LIMITS, timeout=_HTTP_TIMEOUT)
+        self.aclient = AsyncOpenAI(api_key=cfg.openai_api_key, http_client=self._ahttp)
+        self._embed_url = f"{self.aclient.base_url}embeddings"
+        self._embed_headers = {
+            "Authorization": f"Bearer {cfg.openai_api_key}",
+            "Content-Type": "application/json",
+        }
+        # Same org/project scoping the SDK would send (OPENAI_ORG_ID / OPENAI_PROJECT_ID)
+        if self.aclient.organization:
+            self._embed_headers["OpenAI-Organization"] = self.aclient.organization
+        if self.aclient.project:
+            self._embed_headers["OpenAI-Project"] = self.aclient.project
+        self.embed_cache = EmbeddingCache(cfg.embed_cache_path)
+        self._emb_lru: "OrderedDict[Tuple[str, str], np.ndarray]" = OrderedDict()
+        # Near-duplicate answer caches for chat_text, one per (model, system_prompt);
+        # least recently used pairs are dropped beyond CHAT_CACHE_MAX_PROMPTS
+        self._chat_caches: "OrderedDict[Tuple[str, str], SemanticCache]" = OrderedDict()
+        self._chat_caches_lock = threading.Lock()
+        if cfg.openai_usage_tier not in _TIER_LIMITS:
+            raise ValueError(f"Unknown OPENAI_USAGE_TIER {cfg.openai_usage_tier!r}; expected one of {sorted(_TIER_LIMITS)}")
+        self._max_in_flight = _TIER_LIMITS[cfg.openai_usage_tier]
+        # One in-flight bound for every request, blocking or async, from any thread
+        self._slots = threading.BoundedSemaphore(self._max_in_flight)
+        # Retries taken across all calls (individual retries are not logged)
+        self.retries_total = 0
+        # One loop, on its own daemon thread, for all sync->async hops so pooled
+        # async connections stay valid and sync callers never drive a loop
+        self._loop = asyncio.new_event_loop()
+        self._loop_thread = threading.Thread(target=self._loop.run_forever, name="openai-manager-loop", daemon=True)
+        self._loop_thread.start()
+        # Runs on close(), when the manager is garbage-collected, or at exit
+        self._finalizer = weakref.finalize(self, _release, self._loop, self._loop_thread, self._ahttp, self.embed_cache)
+
+    def close(self) -> None:
+        """Release the async connection pool, event loop and embedding cache.
+
+        Idempotent. The sync HTTP client is shared process-wide and closed at exit.
+        """
+        self._finalizer()
+
+    @asynccontextmanager
+    async def _aslot(self) -> AsyncIterator[None]:
+        """Hold one slot of the shared tier semaphore without blocking the loop.
+
+        The semaphore is the same one blocking calls acquire, so sync and
+        async requests together never exceed the tier limit.
+        """
+        while not self._slots.acquire(blocking=False):
+            await asyncio.sleep(_SLOT_POLL_S)
+        try:
+            yield
+        finally:
+            self._slots.release()
+
+    def run_async(self, coro: Awaitable[T]) -> T:
+        """Run a coroutine (e.g. `aembed_texts`) to completion from sync code.
+
+        The coroutine runs on the manager's own loop thread and the caller
+        blocks for the result, so this works from any thread, including one
+        that is already running an event loop (Jupyter, async handlers).
+        """
+        if threading.current_thread() is self._loop_thread:
+            coro.close()
+            raise RuntimeError("OpenAIManager sync methods cannot be called from its own event loop; await the async variant")
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
+    def _retry_policy(self, retries: int) -> Dict[str, Any]:
+        """tenacity arguments shared by the sync and async retry helpers."""
+
+        def _count_retry(_: RetryCallState) -> None:
+            self.retries_total += 1
+
+        return {
+            "stop": stop_after_attempt(max(1, int(retries))),
+            "wait": _retry_wait,
+            "retry": retry_if_exception(_is_retryable),
+            "before_sleep": _count_retry,
+            "reraise": True,
+        }
+
+    def _log_fail(self, label: str, attempts: int, err: Exception) -> None:
+        """Log the final failure of a retried call and flush the log."""
+        # Collapse whitespace so multi-line messages keep the one-line log format
+        self.logger.log_kv(f"OPENAI_{label}_FAIL", attempts=attempts, error=" ".join(str(err).split()))
+        self.logger.flush()
+
+    async def _call_with_retry(self, label: str, retries: int, call: Callable[[], Awaitable[T]]) -> T:
+        """Await `call()` under the tier semaphore, retrying transient failures.
+
+        Each attempt holds one semaphore slot; the slot is released while
+        backing off. Retries are only counted (`retries_total`); a single
+        OPENAI_<label>_FAIL line with the attempt count is logged (then
+        flushed) before the last error is re-raised.
+        """
+        attempts = 0
+        try:
+            async for attempt in AsyncRetrying(**self._retry_policy(retries)):
+                attempts = attempt.retry_state.attempt_number
+                with attempt:
+                    async with self._aslot():
+                        result = await call()
+        except Exception as e:
+            self._log_fail(label, attempts, e)
+            raise
+        return result
+
+    def _call_with_retry_sync(self, label: str, retries: int, call: Callable[[], T]) -> T:
+        """Blocking counterpart of `_call_with_retry` (same tier semaphore)."""
+        attempts = 0
+        try:
+            for attempt in Retrying(**self._retry_policy(retries)):
+                attempts = attempt.retry_state.attempt_number
+                with attempt:
+                    with self._slots:
+                        result = call()
+        except Exception as e:
+            self._log_fail(label, attempts, e)
+            raise
+        return result
+
+    @staticmethod
+    def _json_request(
+        system_prompt: str,
+        user_prompt: str,
+        json_schema: Dict[str, Any],
+        mdl: str,
+        max_output_tokens: int,
+        tmo: float,
+    ) -> Dict[str, Any]:
+        """`chat.completions.create` kwargs for a JSON Schema constrained call."""
+        return {
+            "model": mdl,
+            "messages": [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt},
+            ],
+            "response_format": {
+                "type": "json_schema",
+                "json_schema": {
+                    "name": "structured_output",
+                    "schema": json_schema,
+                    "strict": True,
+                },
+            },
+            "max_tokens": max_output_tokens,
+            "timeout": tmo,
+        }
+
+    @staticmethod
+    def _chat_request(
+        system_prompt: str,
+        user_prompt: str,
+        mdl: str,
+        max_output_tokens: int,
+        temperature: float,
+        tmo: float,
+    ) -> Dict[str, Any]:
+        """`chat.completions.create` kwargs for a plain text call."""
+        return {
+            "model": mdl,
+            "messages": [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt},
+            ],
+            "temperature": temperature,
+            "max_tokens": max_output_tokens,
+            "timeout": tmo,
+        }
+
+    def _chat_cache(self, mdl: str, system_prompt: str) -> SemanticCache:
+        """Semantic answer cache for one (model, system_prompt) pair."""
+        with self._chat_caches_lock:
+            cache = self._chat_caches.get((mdl, system_prompt))
+            if cache is None:
+                cache = self._chat_caches[(mdl, system_prompt)] = SemanticCache()
+                if len(self._chat_caches) > CHAT_CACHE_MAX_PROMPTS:
+                    self._chat_caches.popitem(last=False)
+            else:
+                self._chat_caches.move_to_end((mdl, system_prompt))
+            return cache
 
     # ---------------- Public API ----------------
 
@@ -33,40 +397,44 @@ class OpenAIManager:
 
         Uses OpenAI Python SDK v2.x `chat.completions.create` which supports
         `response_format={"type":"json_schema", "json_schema": {...}}`.
+        The parsed payload is checked against `json_schema`; a payload that
+        does not conform is retried like any other failed attempt.
         """
         mdl = model or self.cfg.openai_model
         tmo = float(timeout_s if timeout_s is not None else self.cfg.request_timeout_seconds)
+        validate = _compiled_schema(orjson.dumps(json_schema, option=orjson.OPT_SORT_KEYS))
+        request = self._json_request(system_prompt, user_prompt, json_schema, mdl, max_output_tokens, tmo)
 
-        last_err: Optional[Exception] = None
-        for attempt in range(1, int(retries) + 1):
-            try:
-                resp = self.client.chat.completions.create(
-                    model=mdl,
-                    messages=[
-                        {"role": "system", "content": system_prompt},
-                        {"role": "user", "content": user_prompt},
-                    ],
-                    response_format={
-                        "type": "json_schema",
-                        "json_schema": {
-                            "name": "structured_output",
-                            "schema": json_schema,
-                            "strict": True,
-                        },
-                    },
-                    max_tokens=max_output_tokens,
-                    timeout=tmo,
-                )
-                content = resp.choices[0].message.content if resp.choices else "{}"
-                return json.loads(content or "{}")
-            except Exception as e:
-                last_err = e
-                self.logger.log_kv("OPENAI_JSON_RETRY", attempt=attempt, error=str(e))
-                time.sleep(min(2 ** attempt, 8))
-        self.logger.log_kv("OPENAI_JSON_FAIL", error=str(last_err) if last_err else "unknown")
-        if last_err:
-            raise last_err
-        raise RuntimeError("structured_json failed")
+        def _call() -> Dict[str, Any]:
+            resp = self.client.chat.completions.create(**request)
+            content = resp.choices[0].message.content if resp.choices else "{}"
+            return validate(orjson.loads(content or "{}"))
+
+        return self._call_with_retry_sync("JSON", retries, _call)
+
+    async def astructured_json(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        json_schema: Dict[str, Any],
+        *,
+        model: Optional[str] = None,
+        max_output_tokens: int = 1500,
+        retries: int = 3,
+        timeout_s: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """Async `structured_json`; each attempt holds a slot of the tier semaphore."""
+        mdl = model or self.cfg.openai_model
+        tmo = float(timeout_s if timeout_s is not None else self.cfg.request_timeout_seconds)
+        validate = _compiled_schema(orjson.dumps(json_schema, option=orjson.OPT_SORT_KEYS))
+        request = self._json_request(system_prompt, user_prompt, json_schema, mdl, max_output_tokens, tmo)
+
+        async def _call() -> Dict[str, Any]:
+            resp = await self.aclient.chat.completions.create(**request)
+            content = resp.choices[0].message.content if resp.choices else "{}"
+            return validate(orjson.loads(content or "{}"))
+
+        return await self._call_with_retry("JSON", retries, _call)
 
     def chat_text(
         self,
@@ -78,61 +446,295 @@ class OpenAIManager:
         temperature: float = 0.0,
         retries: int = 3,
         timeout_s: Optional[float] = None,
+        semantic_cache: bool = False,
     ) -> str:
-        """Plain text completion via Responses API."""
+        """Plain text completion via Responses API.
+
+        Opt-in `semantic_cache` (temperature 0 only): a prompt whose embedding
+        is within cosine 0.87 of an earlier prompt (same model and system
+        prompt, last 5 minutes) returns the earlier answer without a call.
+        This costs an embeddings request per call, and a near-identical
+        prompt (e.g. differing only in a name) gets the earlier answer, so
+        enable it only where that is acceptable.
+        """
         mdl = model or self.cfg.openai_model
         tmo = float(timeout_s if timeout_s is not None else self.cfg.request_timeout_seconds)
 
-        last_err: Optional[Exception] = None
-        for attempt in range(1, int(retries) + 1):
-            try:
-                resp = self.client.chat.completions.create(
-                    model=mdl,
-                    messages=[
-                        {"role": "system", "content": system_prompt},
-                        {"role": "user", "content": user_prompt},
-                    ],
-                    temperature=temperature,
-                    max_tokens=max_output_tokens,
-                    timeout=tmo,
-                )
-                return resp.choices[0].message.content if resp.choices else ""
-            except Exception as e:
-                last_err = e
-                self.logger.log_kv("OPENAI_CHAT_RETRY", attempt=attempt, error=str(e))
-                time.sleep(min(2 ** attempt, 8))
-        self.logger.log_kv("OPENAI_CHAT_FAIL", error=str(last_err) if last_err else "unknown")
-        if last_err:
-            raise last_err
-        raise RuntimeError("chat_text failed")
+        cache: Optional[SemanticCache] = None
+        if semantic_cache and temperature == 0 and user_prompt.strip():
+            cache = self._chat_cache(mdl, system_prompt)
+            query_vec = self.embed_texts([user_prompt])[0]
+            cached = cache.get(query_vec)
+            if cached is not None:
+                self.logger.log_kv("OPENAI_CHAT_SEMANTIC_HIT", model=mdl)
+                return cached
+
+        request = self._chat_request(system_prompt, user_prompt, mdl, max_output_tokens, temperature, tmo)
+
+        def _call() -> str:
+            resp = self.client.chat.completions.create(**request)
+            return resp.choices[0].message.content if resp.choices else ""
+
+        text = self._call_with_retry_sync("CHAT", retries, _call)
+        if cache is not None:
+            cache.put(query_vec, text)
+        return text
+
+    async def achat_text(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        *,
+        model: Optional[str] = None,
+        max_output_tokens: int = 1000,
+        temperature: float = 0.0,
+        retries: int = 3,
+        timeout_s: Optional[float] = None,
+        semantic_cache: bool = False,
+    ) -> str:
+        """Async `chat_text`; each attempt holds a slot of the tier semaphore."""
+        mdl = model or self.cfg.openai_model
+        tmo = float(timeout_s if timeout_s is not None else self.cfg.request_timeout_seconds)
+
+        cache: Optional[SemanticCache] = None
+        if semantic_cache and temperature == 0 and user_prompt.strip():
+            cache = self._chat_cache(mdl, system_prompt)
+            query_vec = (await self.aembed_texts([user_prompt]))[0]
+            cached = cache.get(query_vec)
+            if cached is not None:
+                self.logger.log_kv("OPENAI_CHAT_SEMANTIC_HIT", model=mdl)
+                return cached
+
+        request = self._chat_request(system_prompt, user_prompt, mdl, max_output_tokens, temperature, tmo)
+
+        async def _call() -> str:
+            resp = await self.aclient.chat.completions.create(**request)
+            return resp.choices[0].message.content if resp.choices else ""
+
+        text = await self._call_with_retry("CHAT", retries, _call)
+        if cache is not None:
+            cache.put(query_vec, text)
+        return text
+
+    def batch_structured_json(
+        self,
+        prompts: List[Tuple[str, str]],
+        json_schema: Dict[str, Any],
+        **kwargs: Any,
+    ) -> List[Optional[Dict[str, Any]]]:
+        """Sync facade over `abatch_structured_json`."""
+        return self.run_async(self.abatch_structured_json(prompts, json_schema, **kwargs))
+
+    async def abatch_structured_json(
+        self,
+        prompts: List[Tuple[str, str]],
+        json_schema: Dict[str, Any],
+        **kwargs: Any,
+    ) -> List[Optional[Dict[str, Any]]]:
+        """Run `astructured_json` for many (system_prompt, user_prompt) pairs concurrently.
+
+        In-flight calls are bounded by the tier semaphore and each call keeps
+        its own retry loop. Results follow input order; a prompt that still
+        fails after its retries yields None (and is logged) instead of failing
+        the whole batch. `kwargs` are passed through to `astructured_json`.
+        """
+        results = await asyncio.gather(
+            *(self.astructured_json(sp, up, json_schema, **kwargs) for sp, up in prompts),
+            return_exceptions=True,
+        )
+        return self._batch_results("OPENAI_JSON_BATCH", results)
+
+    def batch_chat_text(self, prompts: List[Tuple[str, str]], **kwargs: Any) -> List[Optional[str]]:
+        """Sync facade over `abatch_chat_text`."""
+        return self.run_async(self.abatch_chat_text(prompts, **kwargs))
+
+    async def abatch_chat_text(self, prompts: List[Tuple[str, str]], **kwargs: Any) -> List[Optional[str]]:
+        """Run `achat_text` for many (system_prompt, user_prompt) pairs concurrently.
+
+        Same semantics as `abatch_structured_json`: input order, None for
+        prompts that failed after retries. `kwargs` go to `achat_text`.
+        """
+        results = await asyncio.gather(
+            *(self.achat_text(sp, up, **kwargs) for sp, up in prompts),
+            return_exceptions=True,
+        )
+        return self._batch_results("OPENAI_CHAT_BATCH", results)
+
+    def _batch_results(self, event: str, results: List[Any]) -> List[Any]:
+        """Replace exceptions from a gathered batch with None; log each failure and a summary."""
+        failed = [i for i, r in enumerate(results) if isinstance(r, BaseException)]
+        for i in failed:
+            err = results[i]
+            detail = " ".join(str(err).split())
+            self.logger.log_kv(f"{event}_ITEM_FAIL", index=i, error=f"{type(err).__name__}: {detail}")
+        self.logger.log_kv(event, total=len(results), failed=len(failed))
+        if failed:
+            self.logger.flush()
+        return [None if isinstance(r, BaseException) else r for r in results]
 
     def embed_texts(
         self,
         texts: Iterable[str],
         *,
         model: Optional[str] = None,
+        batch_size: int = EMBED_MAX_ROWS,
+        retries: int = 3,
+        timeout_s: Optional[float] = None,
+    ) -> np.ndarray:
+        """Batch-embed a list/iterable of strings. Returns a float32 (n, dim) array in input order.
+
+        Blocking facade over `aembed_texts` via `run_async`; safe from any
+        thread, including one running an event loop.
+        """
+        return self.run_async(
+            self.aembed_texts(
+                texts,
+                model=model,
+                batch_size=batch_size,
+                retries=retries,
+                timeout_s=timeout_s,
+            )
+        )
+
+    def iter_embed(
+        self,
+        texts: Iterable[str],
+        *,
+        model: Optional[str] = None,
+        batch_size: int = 256,
         retries: int = 3,
         timeout_s: Optional[float] = None,
-    ) -> List[List[float]]:
-        """Batch-embed a list/iterable of strings. Returns a list of vectors."""
+    ) -> Iterator[np.ndarray]:
+        """Lazily embed an iterable, yielding one float32 (<=batch_size, dim) array per chunk.
+
+        Only `batch_size` texts and their vectors are resident at a time, so
+        large ingests can write each batch downstream as it arrives instead of
+        materializing every input and vector up front.
+        """
+        it = iter(texts)
+        while chunk := list(islice(it, max(1, int(batch_size)))):
+            yield self.embed_texts(chunk, model=model, batch_size=batch_size, retries=retries, timeout_s=timeout_s)
+
+    async def aembed_texts(
+        self,
+        texts: Iterable[str],
+        *,
+        model: Optional[str] = None,
+        batch_size: int = EMBED_MAX_ROWS,
+        retries: int = 3,
+        timeout_s: Optional[float] = None,
+    ) -> np.ndarray:
+        """Async `embed_texts`; returns a float32 (n, dim) array in input order.
+
+        Duplicates and blank inputs are not sent (blank rows are zeros). The
+        rest come from the LRU, then the SQLite cache; misses are embedded in
+        concurrent slices kept under the provider row/token limits.
+        """
         mdl = model or self.cfg.openai_embedding_model
         tmo = float(timeout_s if timeout_s is not None else self.cfg.request_timeout_seconds)
 
-        items = list(texts)
-        last_err: Optional[Exception] = None
-        for attempt in range(1, int(retries) + 1):
-            try:
-                resp = self.client.embeddings.create(
-                    model=mdl,
-                    input=items,
-                    timeout=tmo,
-                )
-                return [d.embedding for d in getattr(resp, "data", [])]
-            except Exception as e:
-                last_err = e
-                self.logger.log_kv("OPENAI_EMBED_RETRY", attempt=attempt, error=str(e))
-                time.sleep(min(2 ** attempt, 8))
-        self.logger.log_kv("OPENAI_EMBED_FAIL", error=str(last_err) if last_err else "unknown")
-        if last_err:
-            raise last_err
-        raise RuntimeError("embed_texts failed")
+        # Embed each distinct text once; `positions` maps inputs back to rows
+        index: Dict[str, int] = {}
+        items: List[str] = []
+        positions: List[int] = []
+        for t in texts:
+            pos = index.setdefault(t, len(items))
+            if pos == len(items):
+                items.append(t)
+            positions.append(pos)
+        arr: Optional[np.ndarray] = None
+
+        def _place(idx: List[int], vecs: np.ndarray) -> None:
+            nonlocal arr
+            if not idx:
+                return
+            if arr is None:
+                # Zero-filled so rows for blank inputs need no extra pass
+                arr = np.zeros((len(items), vecs.shape[1]), dtype=np.float32)
+            arr[idx] = vecs
+
+        lru = self._emb_lru
+        pending: List[int] = []
+        hit_idx: List[int] = []
+        hit_vecs: List[np.ndarray] = []
+        blanks = 0
+        for i, t in enumerate(items):
+            if not (t and t.strip()):
+                blanks += 1
+                continue
+            vec = lru.get((mdl, t))
+            if vec is None:
+                pending.append(i)
+            else:
+                lru.move_to_end((mdl, t))
+                hit_idx.append(i)
+                hit_vecs.append(vec)
+        lru_hits = len(hit_idx)
+
+        keys = {i: EmbeddingCache.key(mdl, items[i]) for i in pending}
+        hits = self.embed_cache.get_many(keys.values())
+        misses: List[int] = []
+        for i in pending:
+            if keys[i] in hits:
+                hit_idx.append(i)
+                hit_vecs.append(hits[keys[i]])
+            else:
+                misses.append(i)
+        self.logger.log_kv(
+            "EMBED_CACHE",
+            duplicates=len(positions) - len(items),
+            blanks=blanks,
+            lru_hits=lru_hits,
+            disk_hits=len(pending) - len(misses),
+            misses=len(misses),
+        )
+        if hit_vecs:
+            _place(hit_idx, np.stack(hit_vecs))
+
+        max_rows = min(max(1, int(batch_size)), EMBED_MAX_ROWS)
+        miss_texts = [items[i] for i in misses]
+        send_texts, slices = _pack_batches(miss_texts, max_rows)
+        truncated = sum(1 for a, b in zip(send_texts, miss_texts) if a is not b)
+        if truncated:
+            self.logger.log_kv("EMBED_TRUNCATED", rows=truncated, max_tokens=EMBED_MAX_ROW_TOKENS)
+
+        async def _slice(start: int, end: int) -> None:
+            vecs = await self._aembed_batch(send_texts[start:end], mdl, tmo, retries)
+            _place(misses[start:end], vecs)
+
+        await asyncio.gather(*(_slice(a, b) for a, b in slices))
+        if arr is None:
+            if mdl not in EMBED_DIMS:
+                raise ValueError(f"No input was embedded and the vector width of {mdl!r} is unknown; add it to EMBED_DIMS")
+            return np.zeros((len(positions), EMBED_DIMS[mdl]), dtype=np.float32)
+        self.embed_cache.put_many((keys[i], arr[i]) for i in misses)
+        for i in pending:
+            # Copy so cached rows do not pin the whole result array
+            lru[(mdl, items[i])] = arr[i].copy()
+            if len(lru) > EMBED_LRU_MAXSIZE:
+                lru.popitem(last=False)
+        if len(items) == len(positions):
+            return arr
+        return np.take(arr, positions, axis=0)
+
+    async def _aembed_batch(self, items: List[str], mdl: str, tmo: float, retries: int) -> np.ndarray:
+        """One embeddings request with retry/backoff; returns a float32 (len(items), dim) array.
+
+        Posted directly on the pooled async client: the body is serialized
+        with orjson and vectors come back base64-encoded, so neither side goes
+        through stdlib json or per-float Python objects.
+        """
+
+        async def _call() -> np.ndarray:
+            resp = await self._ahttp.post(
+                self._embed_url,
+                content=orjson.dumps({"model": mdl, "input": items, "encoding_format": "base64"}),
+                headers=self._embed_headers,
+                timeout=tmo,
+            )
+            if resp.is_error:
+                raise _http_error(resp)
+            data = orjson.loads(resp.content).get("data", [])
+            return np.stack([np.frombuffer(base64.b64decode(d["embedding"]), dtype=np.float32) for d in data])
+
+        return await self._call_with_retry("EMBED", retries, _call)
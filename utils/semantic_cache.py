@@ -0,0 +1,83 @@
+"""In-memory semantic (near-duplicate) cache for model answers.
+
+Maps prompt embeddings to answers; a lookup hits when the closest stored
+prompt has cosine similarity >= threshold. Search is an exact inner product
+over a float32 matrix (equivalent to a flat IP index), which is sub-millisecond
+at the cache sizes used here.
+"""
+from __future__ import annotations
+
+import threading
+import time
+from typing import List, Optional
+
+import numpy as np
+
+
+class SemanticCache:
+    """Bounded cache of ``(prompt_vector -> answer)`` pairs.
+
+    Responsibilities
+    - Return the answer of the most similar cached prompt above `threshold`.
+    - Expire entries older than `ttl_s` and evict the least recently used
+      entry once `max_size` is reached.
+
+    Vectors are L2-normalized on insert/lookup so inner product == cosine.
+    Lookups and inserts are thread-safe.
+    """
+
+    def __init__(self, threshold: float = 0.87, ttl_s: float = 300.0, max_size: int = 1000) -> None:
+        self.threshold = threshold
+        self.ttl_s = ttl_s
+        self.max_size = max_size
+        self._vecs: Optional[np.ndarray] = None  # (n, dim) float32
+        self._answers: List[str] = []
+        self._created: List[float] = []
+        self._used: List[float] = []
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _unit(vec: np.ndarray) -> np.ndarray:
+        v = np.asarray(vec, dtype=np.float32).ravel()
+        norm = float(np.linalg.norm(v))
+        return v / norm if norm else v
+
+    def _drop(self, idx: List[int]) -> None:
+        if not idx:
+            return
+        keep = sorted(set(range(len(self._answers))) - set(idx))
+        self._vecs = self._vecs[keep] if keep else None
+        self._answers = [self._answers[i] for i in keep]
+        self._created = [self._created[i] for i in keep]
+        self._used = [self._used[i] for i in keep]
+
+    def _expire(self, now: float) -> None:
+        self._drop([i for i, t in enumerate(self._created) if now - t > self.ttl_s])
+
+    def get(self, vec: np.ndarray) -> Optional[str]:
+        """Cached answer for the nearest prompt if similarity >= threshold, else None."""
+        query = self._unit(vec)
+        with self._lock:
+            now = time.monotonic()
+            self._expire(now)
+            if self._vecs is None:
+                return None
+            scores = self._vecs @ query
+            best = int(np.argmax(scores))
+            if scores[best] < self.threshold:
+                return None
+            self._used[best] = now
+            return self._answers[best]
+
+    def put(self, vec: np.ndarray, answer: str) -> None:
+        """Store an answer for a prompt vector, evicting the LRU entry when full."""
+        row = self._unit(vec)[None, :]
+        with self._lock:
+            now = time.monotonic()
+            self._expire(now)
+            if len(self._answers) >= self.max_size:
+                self._drop([int(np.argmin(self._used))])
+            self._vecs = row if self._vecs is None else np.vstack([self._vecs, row])
+            self._answers.append(answer)
+            self._created.append(now)
+            self._used.append(now)